@@ -0,0 +1,139 @@
+"""
+In-Process Vector Store & Embedding Stub for Offline Runs
+
+Purpose:
+
+- Stands in for the Pinecone index used by retrieval.py so tests and benchmarks run without network access.
+- Implements the same `upsert` / `query` / `describe_index_stats` surface that retrieval.py calls.
+- Injects configurable (seeded) latency on every call to approximate a remote vector database round trip.
+- Provides a deterministic hashing embedder in place of the SentenceTransformer model.
+
+"""
+
+import hashlib
+import random
+import re
+import time
+
+import numpy as np
+
+
+class LocalIndex:
+    """Brute-force, in-memory replacement for a Pinecone index."""
+
+    def __init__(self, dimension, metric="cosine", latency_ms=0.0, jitter_ms=0.0, seed=None):
+        if metric not in ("cosine", "dotproduct", "euclidean"):
+            raise ValueError(f"Unsupported metric: {metric}")
+
+        self.dimension = int(dimension)
+        self.metric = metric
+        self.latency_ms = float(latency_ms)
+        self.jitter_ms = float(jitter_ms)
+        self._rng = random.Random(seed)
+
+        self._ids = []
+        self._positions = {}
+        self._metadata = []
+        self._vectors = np.empty((0, self.dimension), dtype=np.float32)
+
+    def _simulate_latency(self):
+        """Sleep for latency_ms +/- jitter_ms to mimic a network round trip."""
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms += self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def upsert(self, vectors):
+        """Insert or overwrite (id, values, metadata) tuples."""
+        self._simulate_latency()
+
+        new_rows = []
+        for item in vectors:
+            vector_id, values = str(item[0]), item[1]
+            metadata = dict(item[2]) if len(item) > 2 and item[2] is not None else {}
+
+            values = np.asarray(values, dtype=np.float32)
+            if values.shape != (self.dimension,):
+                raise ValueError(f"Vector dimension {values.shape} does not match index dimension {self.dimension}")
+
+            if vector_id in self._positions:
+                position = self._positions[vector_id]
+                self._vectors[position] = values
+                self._metadata[position] = metadata
+            else:
+                self._positions[vector_id] = len(self._ids)
+                self._ids.append(vector_id)
+                self._metadata.append(metadata)
+                new_rows.append(values)
+
+        if new_rows:
+            self._vectors = np.vstack([self._vectors, np.stack(new_rows)])
+
+        return {"upserted_count": len(vectors)}
+
+    def query(self, vector, top_k=10, include_metadata=False):
+        """Return the top_k nearest vectors in Pinecone's response shape."""
+        self._simulate_latency()
+
+        if not self._ids:
+            return {"matches": []}
+
+        query_vector = np.asarray(vector, dtype=np.float32)
+
+        if self.metric == "cosine":
+            norms = np.linalg.norm(self._vectors, axis=1) * np.linalg.norm(query_vector)
+            dots = self._vectors @ query_vector
+            scores = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+        elif self.metric == "dotproduct":
+            scores = self._vectors @ query_vector
+        else:
+            # Pinecone reports squared euclidean distance; lower is closer
+            scores = -np.sum((self._vectors - query_vector) ** 2, axis=1)
+
+        top_k = min(int(top_k), len(self._ids))
+        # Stable sort keeps insertion order between ties so results are deterministic
+        order = np.argsort(-scores, kind="stable")[:top_k]
+
+        matches = []
+        for position in order:
+            score = float(scores[position])
+            match = {"id": self._ids[position], "score": -score if self.metric == "euclidean" else score}
+            if include_metadata:
+                match["metadata"] = dict(self._metadata[position])
+            matches.append(match)
+
+        return {"matches": matches}
+
+    def describe_index_stats(self):
+        return {
+            "dimension": self.dimension,
+            "index_fullness": 0.0,
+            "total_vector_count": len(self._ids),
+        }
+
+
+class HashEmbeddingModel:
+    """Deterministic bag-of-words embedder exposing SentenceTransformer's `encode`."""
+
+    def __init__(self, dimension):
+        self.dimension = int(dimension)
+
+    def _tokenize(self, text):
+        return re.findall(r"[a-z0-9]+", str(text).lower())
+
+    def _embed(self, text):
+        embedding = np.zeros(self.dimension, dtype=np.float32)
+        for token in self._tokenize(text):
+            digest = hashlib.md5(token.encode("utf-8")).digest()
+            # Signed hashing so bucket collisions tend to cancel out instead of adding up
+            sign = 1.0 if digest[4] & 1 else -1.0
+            embedding[int.from_bytes(digest[:4], "little") % self.dimension] += sign
+
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm > 0 else embedding
+
+    def encode(self, sentences, convert_to_numpy=True):
+        if isinstance(sentences, str):
+            return self._embed(sentences)
+        return np.stack([self._embed(sentence) for sentence in sentences])
@@ -26,7 +26,7 @@ def load_config():
         return yaml.safe_load(file)
 
 config = load_config()
-MOVIE_DATA_PATH = config["data"]["dataset_path"]
+MOVIE_DATA_PATH = os.getenv("CINESENSE_DATASET_PATH", config["data"]["dataset_path"])
 
 class MovieRecommender:
     def __init__(self):
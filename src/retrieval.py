@@ -5,12 +5,12 @@ Purpose:
 
 - This file is responsible for storing and retrieving movie embeddings in/from Pinecone.
 - It converts movie metadata into vector representations and performs similarity searches based on user queries.
+- Set CINESENSE_VECTOR_STORE=local to swap Pinecone and the SentenceTransformer model for the
+  in-process stand-ins in local_vector_store.py (offline tests & benchmarks).
 
 
 """
 
-from sentence_transformers import SentenceTransformer
-from pinecone import Pinecone, ServerlessSpec
 import pandas as pd
 import os
 import yaml
@@ -22,12 +22,8 @@ from collections import Counter
 dotenv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.env"))
 load_dotenv(dotenv_path)
 
-# Fetch API key securely
-PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
-PINECONE_ENV = os.getenv("PINECONE_ENV")
-
-if not PINECONE_API_KEY:
-    raise ValueError("Missing PINECONE_API_KEY. Set it in .env or environment variables.")
+# Vector store backend: "pinecone" (default) or "local"
+VECTOR_STORE = os.getenv("CINESENSE_VECTOR_STORE", "pinecone").lower()
 
 # Load configuration
 def load_config():
@@ -41,31 +37,57 @@ INDEX_NAME = config["pinecone"]["index_name"]
 DIMENSION = int(config["pinecone"]["dimension"])
 METRIC = config["pinecone"]["metric"]
 
-if not PINECONE_API_KEY:
-    raise ValueError("Missing PINECONE_API_KEY. Set it in .env or environment variables.")
-
-pc = Pinecone(api_key=PINECONE_API_KEY)
+if VECTOR_STORE == "local":
+    from src.local_vector_store import LocalIndex, HashEmbeddingModel
 
-# Check if the index exists, else create it
-if INDEX_NAME not in pc.list_indexes().names():
-    pc.create_index(
-        name=INDEX_NAME,
+    local_config = config["local_vector_store"]
+    index = LocalIndex(
         dimension=DIMENSION,
         metric=METRIC,
-        spec=ServerlessSpec(
-            cloud="aws",  
-            region=PINECONE_ENV  
-        )
+        latency_ms=float(os.getenv("CINESENSE_LOCAL_LATENCY_MS", local_config["latency_ms"])),
+        jitter_ms=float(local_config["jitter_ms"]),
+        seed=local_config["seed"]
     )
-    print(f'Pinecone Index "{INDEX_NAME}" created successfully!')
 
-index = pc.Index(INDEX_NAME)
+    # Deterministic embedding stub, no model download
+    model = HashEmbeddingModel(DIMENSION)
+
+elif VECTOR_STORE == "pinecone":
+    from sentence_transformers import SentenceTransformer
+    from pinecone import Pinecone, ServerlessSpec
 
-# Load embedding model 
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    # Fetch API key securely
+    PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
+    PINECONE_ENV = os.getenv("PINECONE_ENV")
+
+    if not PINECONE_API_KEY:
+        raise ValueError("Missing PINECONE_API_KEY. Set it in .env or environment variables.")
+
+    pc = Pinecone(api_key=PINECONE_API_KEY)
+
+    # Check if the index exists, else create it
+    if INDEX_NAME not in pc.list_indexes().names():
+        pc.create_index(
+            name=INDEX_NAME,
+            dimension=DIMENSION,
+            metric=METRIC,
+            spec=ServerlessSpec(
+                cloud="aws",  
+                region=PINECONE_ENV  
+            )
+        )
+        print(f'Pinecone Index "{INDEX_NAME}" created successfully!')
+
+    index = pc.Index(INDEX_NAME)
+
+    # Load embedding model 
+    model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+
+else:
+    raise ValueError(f"Unknown CINESENSE_VECTOR_STORE '{VECTOR_STORE}'. Use 'pinecone' or 'local'.")
 
 # path to movie dataset
-MOVIE_DATA_PATH = config["data"]["dataset_path"]
+MOVIE_DATA_PATH = os.getenv("CINESENSE_DATASET_PATH", config["data"]["dataset_path"])
 
 if not os.path.exists(MOVIE_DATA_PATH):
     raise FileNotFoundError(f"❌ Movie dataset not found at {MOVIE_DATA_PATH}")
@@ -132,7 +154,7 @@ def store_movie_embeddings():
    
     # Extract year
     df["year"] = df["title"].apply(lambda x: int(re.search(r"\((\d{4})\)", str(x)).group(1)) if re.search(r"\((\d{4})\)", str(x)) else None)
-    df["year"].fillna(0, inplace=True)  # Fill missing years
+    df["year"] = df["year"].fillna(0)  # Fill missing years
     df["year"] = df["year"].astype(int)  # Ensure integer type
 
     # Ensure dataset has the required columns
@@ -179,6 +201,10 @@ def retrieve_similar_movies(query, top_k=5):
     """Returns top-k unique similar movies based on content similarity."""
 
     print(f"🔍 Processing query: {query}")
+    if not query.strip():
+        print("⚠️ Empty query, skipping vector search.")
+        return []
+
     query_embedding = model.encode(query, convert_to_numpy=True).tolist()
 
     result = index.query(vector=query_embedding, top_k=top_k * 3, include_metadata=True)  # Fetch more results
@@ -195,7 +221,8 @@ def retrieve_similar_movies(query, top_k=5):
         metadata = match.get("metadata", {})
         movie_id = match.get("id", None)  # Ensure 'id' is captured
 
-        if movie_id and "title" in metadata:
+        # Skip matches with no similarity at all (e.g. nonsense queries)
+        if movie_id and "title" in metadata and match["score"] > 0:
             recommendations.append({
                 "id": movie_id,  # Ensure 'id' is included
                 "title": metadata.get("title", "Unknown Title"),
@@ -0,0 +1,8 @@
+import os
+
+# Run the suite offline by default: in-process vector store + MovieLens fixture catalogue.
+# Export CINESENSE_VECTOR_STORE=pinecone (and CINESENSE_DATASET_PATH) to test against a live index.
+FIXTURE_DATASET_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "fixtures/movie_dataset.csv"))
+
+os.environ.setdefault("CINESENSE_VECTOR_STORE", "local")
+os.environ.setdefault("CINESENSE_DATASET_PATH", FIXTURE_DATASET_PATH)
@@ -0,0 +1,49 @@
+import unittest
+import time
+from src.local_vector_store import LocalIndex, HashEmbeddingModel
+
+class TestLocalVectorStore(unittest.TestCase):
+
+    def setUp(self):
+        self.index = LocalIndex(dimension=3, metric="cosine")
+        self.index.upsert(vectors=[
+            ("1", [1.0, 0.0, 0.0], {"title": "A"}),
+            ("2", [0.0, 1.0, 0.0], {"title": "B"}),
+            ("3", [1.0, 1.0, 0.0], {"title": "C"}),
+        ])
+
+    def test_query_ranking(self):
+        result = self.index.query(vector=[1.0, 0.0, 0.0], top_k=2, include_metadata=True)
+        self.assertEqual([match["id"] for match in result["matches"]], ["1", "3"])
+        self.assertAlmostEqual(result["matches"][0]["score"], 1.0, places=5)
+        self.assertEqual(result["matches"][0]["metadata"], {"title": "A"})
+
+    def test_upsert_overwrites(self):
+        self.index.upsert(vectors=[("2", [1.0, 0.0, 0.0], {"title": "B2"})])
+        self.assertEqual(self.index.describe_index_stats()["total_vector_count"], 3)
+
+        result = self.index.query(vector=[0.0, 1.0, 0.0], top_k=1, include_metadata=True)
+        self.assertEqual(result["matches"][0]["id"], "3")
+
+    def test_dimension_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.index.upsert(vectors=[("4", [1.0, 0.0], {})])
+
+    def test_latency_injection(self):
+        slow_index = LocalIndex(dimension=3, latency_ms=20, jitter_ms=5, seed=0)
+
+        start = time.perf_counter()
+        slow_index.query(vector=[1.0, 0.0, 0.0], top_k=1)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.015)
+
+    def test_embedding_deterministic(self):
+        model = HashEmbeddingModel(dimension=384)
+        first = model.encode("Star Wars Sci-Fi", convert_to_numpy=True)
+        second = model.encode("star wars sci fi", convert_to_numpy=True)
+
+        self.assertEqual(first.shape, (384,))
+        self.assertEqual(first.tolist(), second.tolist())
+        self.assertEqual(model.encode("", convert_to_numpy=True).tolist(), [0.0] * 384)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import time
+from src.retrieval import store_movie_embeddings, get_pinecone_record_count, index, VECTOR_STORE
+from src.recommendation import MovieRecommender
+
+# Number of requests issued by the throughput check
+THROUGHPUT_QUERIES = 50
+
+@unittest.skipUnless(VECTOR_STORE == "local", "Requires the local fixture catalogue")
+class TestRecommendation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if get_pinecone_record_count() == 0:
+            store_movie_embeddings()
+        cls.recommender = MovieRecommender()
+
+    def test_recommendations_shape(self):
+        results = self.recommender.get_movie_recommendations("sci-fi action", top_n=5)
+
+        self.assertGreater(len(results), 0, "No recommendations returned!")
+        self.assertLessEqual(len(results), 5)
+        for movie in results:
+            self.assertEqual(set(movie), {"title", "genres", "rating", "score"})
+
+    def test_genre_and_rating_filter(self):
+        results = self.recommender.get_movie_recommendations("sci-fi action", top_n=5, genre_filter="Sci-Fi", min_rating=4)
+
+        self.assertGreater(len(results), 0, "No recommendations returned!")
+        for movie in results:
+            self.assertIn("Sci-Fi", movie["genres"])
+            self.assertGreaterEqual(movie["rating"], 4)
+
+    def test_unique_titles(self):
+        results = self.recommender.get_movie_recommendations("comedy", top_n=10)
+        titles = [movie["title"] for movie in results]
+        self.assertEqual(len(titles), len(set(titles)), "Duplicate titles in recommendations.")
+
+    def test_recommendation_throughput(self):
+        """Measure end-to-end recommendation throughput including filtering."""
+        start = time.perf_counter()
+        for _ in range(THROUGHPUT_QUERIES):
+            self.recommender.get_movie_recommendations("sci-fi action", top_n=5, genre_filter="Sci-Fi", min_rating=3)
+        elapsed = time.perf_counter() - start
+
+        min_latency_s = max(index.latency_ms - index.jitter_ms, 0) / 1000.0
+        self.assertGreaterEqual(elapsed, THROUGHPUT_QUERIES * min_latency_s)
+
+        overhead_s = elapsed / THROUGHPUT_QUERIES - index.latency_ms / 1000.0
+        self.assertLess(overhead_s, 0.05, f"Per-request overhead too high: {overhead_s * 1000:.1f} ms")
+
+        print(f"\n⏱️ Recommendation: {THROUGHPUT_QUERIES / elapsed:.1f} requests/s ({elapsed / THROUGHPUT_QUERIES * 1000:.1f} ms/request)")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import time
+from fastapi.testclient import TestClient
+from src.retrieval import store_movie_embeddings, get_pinecone_record_count, index, VECTOR_STORE
+from src.retrieval_api import app
+
+# Number of requests issued by the throughput check
+THROUGHPUT_QUERIES = 50
+
+@unittest.skipUnless(VECTOR_STORE == "local", "Requires the local fixture catalogue")
+class TestRetrievalAPI(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        if get_pinecone_record_count() == 0:
+            store_movie_embeddings()
+        cls.client = TestClient(app)
+
+    def test_home(self):
+        response = self.client.get("/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("message", response.json())
+
+    def test_recommend(self):
+        response = self.client.get("/recommend", params={"query": "sci-fi action", "top_k": 5})
+        self.assertEqual(response.status_code, 200)
+
+        body = response.json()
+        self.assertEqual(body["query"], "sci-fi action")
+        self.assertGreater(len(body["results"]), 0)
+        self.assertLessEqual(len(body["results"]), 5)
+
+    def test_recommend_filters(self):
+        response = self.client.get("/recommend", params={"query": "sci-fi action", "genre": "Sci-Fi", "min_rating": 4})
+        self.assertEqual(response.status_code, 200)
+
+        for movie in response.json()["results"]:
+            self.assertIn("sci-fi", movie["genres"].lower())
+            self.assertGreaterEqual(movie["rating"], 4)
+
+    def test_empty_query(self):
+        response = self.client.get("/recommend", params={"query": "   "})
+        self.assertEqual(response.status_code, 400)
+
+    def test_no_results(self):
+        response = self.client.get("/recommend", params={"query": "xqzvw"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_api_throughput(self):
+        """Measure /recommend throughput through the ASGI stack."""
+        start = time.perf_counter()
+        for _ in range(THROUGHPUT_QUERIES):
+            response = self.client.get("/recommend", params={"query": "horror classics", "top_k": 5})
+            self.assertEqual(response.status_code, 200)
+        elapsed = time.perf_counter() - start
+
+        min_latency_s = max(index.latency_ms - index.jitter_ms, 0) / 1000.0
+        self.assertGreaterEqual(elapsed, THROUGHPUT_QUERIES * min_latency_s)
+
+        overhead_s = elapsed / THROUGHPUT_QUERIES - index.latency_ms / 1000.0
+        self.assertLess(overhead_s, 0.05, f"Per-request overhead too high: {overhead_s * 1000:.1f} ms")
+
+        print(f"\n⏱️ API: {THROUGHPUT_QUERIES / elapsed:.1f} requests/s ({elapsed / THROUGHPUT_QUERIES * 1000:.1f} ms/request)")
+
+if __name__ == "__main__":
+    unittest.main()